@@ -1,9 +1,13 @@
 import logging
-import json
+import math
+import asyncio
 import aiohttp
+import orjson
 from asyncio import TimeoutError
 from datetime import (datetime, timedelta, time)
+from operator import itemgetter
 from threading import RLock
+from typing import Callable
 
 from homeassistant.util.dt import (as_utc, now, as_local, parse_datetime)
 
@@ -93,6 +97,11 @@ account_query = '''query {{
   }}
 }}'''
 
+# These queries are sent on every account refresh, so unescape their templates up front and substitute
+# our values with a plain replace rather than having format parse the whole template on each request
+api_token_query_template = api_token_query.replace('{{', '{').replace('}}', '}')
+account_query_template = account_query.replace('{{', '{').replace('}}', '}')
+
 live_consumption_query = '''query {{
 	smartMeterTelemetry(
     deviceId: "{device_id}"
@@ -287,19 +296,26 @@ greenness_forecast_query = '''query {
 
 user_agent_value = "bottlecapdave-home-assistant-octopus-energy"
 
-def get_valid_from(rate):
-  return rate["valid_from"]
+thirty_minutes = timedelta(minutes=30)
+
+tariff_response_cache_size = 20
+
+def parse_utc_datetime(value: str) -> datetime:
+  """Parses an ISO 8601 date time string returned by the API into a UTC date time"""
+  # fromisoformat natively handles the Z suffix used by the API and is quicker than parse_datetime for our larger responses
+  return as_utc(datetime.fromisoformat(value))
 
-def get_start(rate):
-  return rate["start"]
+valid_from_key = itemgetter("valid_from")
+start_key = itemgetter("start")
+end_key = itemgetter("end")
     
-def rates_to_thirty_minute_increments(data, period_from: datetime, period_to: datetime, tariff_code: str, price_cap: float = None):
-  """Process the collection of rates to ensure they're in 30 minute periods"""
+def rates_to_thirty_minute_increments(data, period_from: datetime, period_to: datetime, tariff_code: str, price_cap: float = None, is_valid_period: Callable[[datetime], bool] = None):
+  """Process the collection of rates to ensure they're in 30 minute periods, optionally only keeping the periods whose start is valid"""
   starting_period_from = period_from
   results = []
   if ("results" in data):
     items = data["results"]
-    items.sort(key=get_valid_from)
+    items.sort(key=valid_from_key)
 
     # We need to normalise our data into 30 minute increments so that all of our rates across all tariffs are the same and it's 
     # easier to calculate our target rate sensors
@@ -312,7 +328,7 @@ def rates_to_thirty_minute_increments(data, period_from: datetime, period_to: da
         is_capped = True
 
       if "valid_from" in item and item["valid_from"] is not None:
-        valid_from = as_utc(parse_datetime(item["valid_from"]))
+        valid_from = parse_utc_datetime(item["valid_from"])
 
         # If we're on a fixed rate, then our current time could be in the past so we should go from
         # our target period from date otherwise we could be adjusting times quite far in the past
@@ -323,7 +339,7 @@ def rates_to_thirty_minute_increments(data, period_from: datetime, period_to: da
 
       # Some rates don't have end dates, so we should treat this as our period to target
       if "valid_to" in item and item["valid_to"] is not None:
-        target_date = as_utc(parse_datetime(item["valid_to"]))
+        target_date = parse_utc_datetime(item["valid_to"])
 
         # Cap our target date to our end period
         if (target_date > period_to):
@@ -331,18 +347,19 @@ def rates_to_thirty_minute_increments(data, period_from: datetime, period_to: da
       else:
         target_date = period_to
       
-      while valid_from < target_date:
-        valid_to = valid_from + timedelta(minutes=30)
-        results.append({
+      # The number of 30 minute periods between our dates is known up front, so generate them all at once
+      total_periods = math.ceil((target_date - valid_from) / thirty_minutes)
+      if total_periods > 0:
+        period_starts = [valid_from + (thirty_minutes * index) for index in range(total_periods)]
+        results.extend({
           "value_inc_vat": value_inc_vat,
-          "start": valid_from,
-          "end": valid_to,
+          "start": start,
+          "end": start + thirty_minutes,
           "tariff_code": tariff_code,
           "is_capped": is_capped
-        })
+        } for start in period_starts if is_valid_period is None or is_valid_period(start))
 
-        valid_from = valid_to
-        starting_period_from = valid_to
+        starting_period_from = valid_from + (thirty_minutes * total_periods)
     
   return results
 
@@ -360,39 +377,58 @@ class RequestException(ApiException):
     self.errors = errors
 
 class OctopusEnergyApiClient:
-  _refresh_token_lock = RLock()
   _session_lock = RLock()
 
+  # Our REST endpoints, precompiled so each request only has to fill in its values
+  _product_url = '{base_url}/v1/products/{product_code}'.format
+  _tariff_url = '{base_url}/v1/products/{product_code}/{tariff_type}/{tariff_code}/{endpoint}?period_from={period_from}&period_to={period_to}'.format
+  _paged_tariff_url = '{base_url}/v1/products/{product_code}/{tariff_type}/{tariff_code}/{endpoint}?period_from={period_from}&period_to={period_to}&page={page}'.format
+  _consumption_url = '{base_url}/v1/{meter_point_type}/{meter_point}/meters/{serial_number}/consumption?period_from={period_from}&period_to={period_to}'.format
+
   def __init__(self, api_key, electricity_price_cap = None, gas_price_cap = None, timeout_in_seconds = 20):
     if (api_key is None):
       raise Exception('API KEY is not set')
 
     self._api_key = api_key
     self._base_url = 'https://api.octopus.energy'
+    self._graphql_url = f'{self._base_url}/v1/graphql/'
 
     self._graphql_token = None
     self._graphql_expiration = None
+    # Our token request only depends on our api key, so serialize it once
+    self._token_request_body = orjson.dumps({ "query": api_token_query_template.replace("{api_key}", self._api_key) })
+    # Our requests run concurrently on the event loop, so use an asyncio lock to make sure only one of them refreshes our token
+    self._refresh_token_lock = asyncio.Lock()
 
     self._product_tracker_cache = dict()
+    self._tariff_response_cache = dict()
 
     self._electricity_price_cap = electricity_price_cap
     self._gas_price_cap = gas_price_cap
 
     self._timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout_in_seconds, sock_read=timeout_in_seconds)
     self._default_headers = { "user-agent": f'{user_agent_value}/{INTEGRATION_VERSION}' }
+    self._auth = aiohttp.BasicAuth(self._api_key, '')
 
     self._session = None
 
   async def async_close(self):
     with self._session_lock:
-      await self._session.close()
+      if self._session is not None:
+        await self._session.close()
+        self._session = None
 
   def _create_client_session(self):
     if self._session is not None:
       return self._session
     
     with self._session_lock:
-      self._session = aiohttp.ClientSession(timeout=self._timeout, headers=self._default_headers)
+      # Check that our session wasn't created while waiting for the lock
+      if self._session is None:
+        # Keep connections alive between our polls so we're not performing a new TLS handshake for every request
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=75)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout, headers=self._default_headers)
+
       return self._session
 
   async def async_refresh_token(self):
@@ -400,16 +436,16 @@ class OctopusEnergyApiClient:
     if (self._graphql_expiration is not None and (self._graphql_expiration - timedelta(minutes=5)) > now()):
       return
 
-    with self._refresh_token_lock:
+    async with self._refresh_token_lock:
       # Check that our token wasn't refreshed while waiting for the lock
       if (self._graphql_expiration is not None and (self._graphql_expiration - timedelta(minutes=5)) > now()):
         return
 
       try:
         client = self._create_client_session()
-        url = f'{self._base_url}/v1/graphql/'
-        payload = { "query": api_token_query.format(api_key=self._api_key) }
-        async with client.post(url, json=payload) as token_response:
+        url = self._graphql_url
+        headers = { "Content-Type": "application/json" }
+        async with client.post(url, data=self._token_request_body, headers=headers) as token_response:
           token_response_body = await self.__async_read_response__(token_response, url)
           if (token_response_body is not None and 
               "data" in token_response_body and
@@ -431,14 +467,14 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       # Get account response
-      payload = { "query": account_query.format(account_id=account_id) }
-      headers = { "Authorization": f"JWT {self._graphql_token}" }
-      async with client.post(url, json=payload, headers=headers) as account_response:
+      payload = orjson.dumps({ "query": account_query_template.replace("{account_id}", account_id) })
+      headers = { "Authorization": f"JWT {self._graphql_token}", "Content-Type": "application/json" }
+      async with client.post(url, data=payload, headers=headers) as account_response:
         account_response_body = await self.__async_read_response__(account_response, url)
 
-        _LOGGER.debug(f'account: {account_response_body}')
+        _LOGGER.debug('account: %s', account_response_body)
 
         if (account_response_body is not None and 
             "data" in account_response_body and 
@@ -449,9 +485,9 @@ class OctopusEnergyApiClient:
             "octoplus_enrolled": account_response_body["data"]["octoplusAccountInfo"]["isOctoplusEnrolled"] == True 
             if "octoplusAccountInfo" in account_response_body["data"] and "isOctoplusEnrolled" in account_response_body["data"]["octoplusAccountInfo"]
             else False,
-            "electricity_meter_points": list(map(lambda mp: {
-                "mpan": mp["meterPoint"]["mpan"],
-                "meters": list(map(lambda m: {
+            "electricity_meter_points": [{
+                "mpan": (meter_point := mp["meterPoint"])["mpan"],
+                "meters": [{
                     "serial_number": m["serialNumber"],
                     "is_export": m["smartExportElectricityMeter"] is not None,
                     "is_smart_meter": f'{m["meterType"]}'.startswith("S1") or f'{m["meterType"]}'.startswith("S2"),
@@ -471,62 +507,68 @@ class OctopusEnergyApiClient:
                       else m["smartExportElectricityMeter"]["firmwareVersion"] 
                       if m["smartExportElectricityMeter"] is not None
                       else None
-                  },
-                  mp["meterPoint"]["meters"]
-                  if "meterPoint" in mp and "meters" in mp["meterPoint"] and mp["meterPoint"]["meters"] is not None
-                  else []
-                )),
-                "agreements": list(map(lambda a: {
-                  "start": a["validFrom"],
-                  "end": a["validTo"],
-                  "tariff_code": a["tariff"]["tariffCode"] if "tariff" in a and "tariffCode" in a["tariff"] else None,
-                  "product_code": a["tariff"]["productCode"] if "tariff" in a and "productCode" in a["tariff"] else None,
-                }, 
-                mp["meterPoint"]["agreements"]
-                if "meterPoint" in mp and "agreements" in mp["meterPoint"] and mp["meterPoint"]["agreements"] is not None
-                else []
-              ))
-            }, 
-            account_response_body["data"]["account"]["electricityAgreements"]
-            if "electricityAgreements" in account_response_body["data"]["account"] and account_response_body["data"]["account"]["electricityAgreements"] is not None
-            else []
-          )),
-            "gas_meter_points": list(map(lambda mp: {
-              "mprn": mp["meterPoint"]["mprn"],
-              "meters": list(map(lambda m: {
-                  "serial_number": m["serialNumber"],
-                  "consumption_units": m["consumptionUnits"],
-                  "is_smart_meter": m["mechanism"] == "S1" or m["mechanism"] == "S2",
-                  "device_id": m["smartGasMeter"]["deviceId"] if m["smartGasMeter"] is not None else None,
-                  "manufacturer": m["smartGasMeter"]["manufacturer"] 
-                    if m["smartGasMeter"] is not None 
-                    else m["modelName"],
-                  "model": m["smartGasMeter"]["model"] 
-                    if m["smartGasMeter"] is not None 
-                    else None,
-                  "firmware": m["smartGasMeter"]["firmwareVersion"] 
-                    if m["smartGasMeter"] is not None 
-                    else None
-                },
-                mp["meterPoint"]["meters"]
-                if "meterPoint" in mp and "meters" in mp["meterPoint"] and mp["meterPoint"]["meters"] is not None
+                  } for m in (
+                    meter_point["meters"]
+                    if "meters" in meter_point and meter_point["meters"] is not None
+                    else []
+                  )
+                ],
+                "agreements": [{
+                    "start": a["validFrom"],
+                    "end": a["validTo"],
+                    "tariff_code": a["tariff"]["tariffCode"] if "tariff" in a and "tariffCode" in a["tariff"] else None,
+                    "product_code": a["tariff"]["productCode"] if "tariff" in a and "productCode" in a["tariff"] else None,
+                  } for a in (
+                    meter_point["agreements"]
+                    if "agreements" in meter_point and meter_point["agreements"] is not None
+                    else []
+                  )
+                ]
+              } for mp in (
+                account_response_body["data"]["account"]["electricityAgreements"]
+                if "electricityAgreements" in account_response_body["data"]["account"] and account_response_body["data"]["account"]["electricityAgreements"] is not None
                 else []
-              )),
-              "agreements": list(map(lambda a: {
-                  "start": a["validFrom"],
-                  "end": a["validTo"],
-                  "tariff_code": a["tariff"]["tariffCode"] if "tariff" in a and "tariffCode" in a["tariff"] else None,
-                  "product_code": a["tariff"]["productCode"] if "tariff" in a and "productCode" in a["tariff"] else None,
-                },
-                mp["meterPoint"]["agreements"]
-                if "meterPoint" in mp and "agreements" in mp["meterPoint"] and mp["meterPoint"]["agreements"] is not None
+              )
+            ],
+            "gas_meter_points": [{
+                "mprn": (meter_point := mp["meterPoint"])["mprn"],
+                "meters": [{
+                    "serial_number": m["serialNumber"],
+                    "consumption_units": m["consumptionUnits"],
+                    "is_smart_meter": m["mechanism"] == "S1" or m["mechanism"] == "S2",
+                    "device_id": m["smartGasMeter"]["deviceId"] if m["smartGasMeter"] is not None else None,
+                    "manufacturer": m["smartGasMeter"]["manufacturer"] 
+                      if m["smartGasMeter"] is not None 
+                      else m["modelName"],
+                    "model": m["smartGasMeter"]["model"] 
+                      if m["smartGasMeter"] is not None 
+                      else None,
+                    "firmware": m["smartGasMeter"]["firmwareVersion"] 
+                      if m["smartGasMeter"] is not None 
+                      else None
+                  } for m in (
+                    meter_point["meters"]
+                    if "meters" in meter_point and meter_point["meters"] is not None
+                    else []
+                  )
+                ],
+                "agreements": [{
+                    "start": a["validFrom"],
+                    "end": a["validTo"],
+                    "tariff_code": a["tariff"]["tariffCode"] if "tariff" in a and "tariffCode" in a["tariff"] else None,
+                    "product_code": a["tariff"]["productCode"] if "tariff" in a and "productCode" in a["tariff"] else None,
+                  } for a in (
+                    meter_point["agreements"]
+                    if "agreements" in meter_point and meter_point["agreements"] is not None
+                    else []
+                  )
+                ]
+              } for mp in (
+                account_response_body["data"]["account"]["gasAgreements"]
+                if "gasAgreements" in account_response_body["data"]["account"] and account_response_body["data"]["account"]["gasAgreements"] is not None
                 else []
-              ))
-            }, 
-            account_response_body["data"]["account"]["gasAgreements"] 
-            if "gasAgreements" in account_response_body["data"]["account"] and account_response_body["data"]["account"]["gasAgreements"] is not None
-            else []
-          )),
+              )
+            ],
         }
         else:
           _LOGGER.error("Failed to retrieve account")
@@ -543,7 +585,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": greenness_forecast_query }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as greenness_forecast_response:
@@ -569,7 +611,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       # Get account response
       payload = { "query": octoplus_saving_session_query.format(account_id=account_id) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
@@ -603,7 +645,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       # Get account response
       payload = { "query": octoplus_points_query }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
@@ -627,7 +669,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       # Get account response
       payload = { "query": octoplus_saving_session_join_mutation.format(account_id=account_id, event_code=event_code) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
@@ -649,7 +691,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
 
       payload = { "query": live_consumption_query.format(device_id=device_id, period_from=period_from.strftime("%Y-%m-%dT%H:%M:%S%z"), period_to=period_to.strftime("%Y-%m-%dT%H:%M:%S%z")) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
@@ -664,7 +706,7 @@ class OctopusEnergyApiClient:
             "end": parse_datetime(mp["readAt"]) + timedelta(minutes=30)
           }, response_body["data"]["smartMeterTelemetry"]))
         else:
-          _LOGGER.debug(f"Failed to retrieve smart meter consumption data - device_id: {device_id}; period_from: {period_from}; period_to: {period_to}")
+          _LOGGER.debug("Failed to retrieve smart meter consumption data - device_id: %s; period_from: %s; period_to: %s", device_id, period_from, period_to)
     
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
@@ -674,31 +716,7 @@ class OctopusEnergyApiClient:
 
   async def async_get_electricity_standard_rates(self, product_code, tariff_code, period_from, period_to): 
     """Get the current standard rates"""
-    results = []
-
-    try:
-      client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      page = 1
-      has_more_rates = True
-      while has_more_rates:
-        url = f'{self._base_url}/v1/products/{product_code}/electricity-tariffs/{tariff_code}/standard-unit-rates?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}&page={page}'
-        async with client.get(url, auth=auth) as response:
-          data = await self.__async_read_response__(response, url)
-          if data is None:
-            return None
-          else:
-            results = results + rates_to_thirty_minute_increments(data, period_from, period_to, tariff_code, self._electricity_price_cap)
-            has_more_rates = "next" in data and data["next"] is not None
-            if has_more_rates:
-              page = page + 1
-    
-    except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-      raise TimeoutException()
-    
-    results.sort(key=get_start)
-    return results
+    return await self.__async_get_standard_rates("electricity-tariffs", product_code, tariff_code, period_from, period_to, self._electricity_price_cap)
 
   async def async_get_electricity_day_night_rates(self, product_code, tariff_code, is_smart_meter, period_from, period_to):
     """Get the current day and night rates"""
@@ -706,38 +724,42 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/products/{product_code}/electricity-tariffs/{tariff_code}/day-unit-rates?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
-        data = await self.__async_read_response__(response, url)
-        if data is None:
-          return None
-        else:
-          # Normalise the rates to be in 30 minute increments and remove any rates that fall outside of our day period 
-          day_rates = rates_to_thirty_minute_increments(data, period_from, period_to, tariff_code, self._electricity_price_cap)
-          for rate in day_rates:
-            if (self.__is_night_rate(rate, is_smart_meter)) == False:
-              results.append(rate)
-
-      url = f'{self._base_url}/v1/products/{product_code}/electricity-tariffs/{tariff_code}/night-unit-rates?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
-        data = await self.__async_read_response__(response, url)
-        if data is None:
-          return None
-
-        # Normalise the rates to be in 30 minute increments and remove any rates that fall outside of our night period 
-        night_rates = rates_to_thirty_minute_increments(data, period_from, period_to, tariff_code, self._electricity_price_cap)
-        for rate in night_rates:
-          if (self.__is_night_rate(rate, is_smart_meter)) == True:
-            results.append(rate)
+      period_from_str = period_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+      period_to_str = period_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+      day_url = self._tariff_url(base_url=self._base_url, product_code=product_code, tariff_type="electricity-tariffs", tariff_code=tariff_code, endpoint="day-unit-rates", period_from=period_from_str, period_to=period_to_str)
+      night_url = self._tariff_url(base_url=self._base_url, product_code=product_code, tariff_type="electricity-tariffs", tariff_code=tariff_code, endpoint="night-unit-rates", period_from=period_from_str, period_to=period_to_str)
+
+      # Our day and night rates are independent of each other, so we can retrieve them at the same time
+      day_rates, night_rates = await asyncio.gather(
+        self.__async_get_day_night_rates(client, day_url, tariff_code, is_smart_meter, False, period_from, period_to),
+        self.__async_get_day_night_rates(client, night_url, tariff_code, is_smart_meter, True, period_from, period_to)
+      )
+
+      if day_rates is None or night_rates is None:
+        return None
+      
+      results = day_rates + night_rates
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
 
     # Because we retrieve our day and night periods separately over a 2 day period, we need to sort our rates 
-    results.sort(key=get_start)
+    results.sort(key=start_key)
 
     return results
+  
+  async def __async_get_day_night_rates(self, client, url, tariff_code, is_smart_meter, is_night, period_from, period_to):
+    data = await self.__async_get_tariff_data(client, url)
+    if data is None:
+      return None
+
+    # Normalise the rates to be in 30 minute increments, only keeping the rates that fall within our target period 
+    return rates_to_thirty_minute_increments(data,
+                                             period_from,
+                                             period_to,
+                                             tariff_code,
+                                             self._electricity_price_cap,
+                                             lambda start: self.__is_night_rate(start, is_smart_meter) == is_night)
 
   async def async_get_electricity_rates(self, tariff_code: str, is_smart_meter: bool, period_from: datetime, period_to: datetime):
     """Get the current rates"""
@@ -758,23 +780,25 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/electricity-meter-points/{mpan}/meters/{serial_number}/consumption?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
+      period_from_str = period_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+      period_to_str = period_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+      url = self._consumption_url(base_url=self._base_url, meter_point_type="electricity-meter-points", meter_point=mpan, serial_number=serial_number, period_from=period_from_str, period_to=period_to_str)
+      async with client.get(url, auth=self._auth) as response:
         
         data = await self.__async_read_response__(response, url)
         if (data is not None and "results" in data):
           data = data["results"]
           results = []
           for item in data:
-            item = self.__process_consumption(item)
+            start = parse_utc_datetime(item["interval_start"])
+            end = parse_utc_datetime(item["interval_end"])
 
             # For some reason, the end point returns slightly more data than we requested, so we need to filter out
-            # the results
-            if as_utc(item["start"]) >= period_from and as_utc(item["end"]) <= period_to:
-              results.append(item)
+            # the results before processing them
+            if start >= period_from and end <= period_to:
+              results.append(self.__process_consumption(item, start, end))
           
-          results.sort(key=self.__get_interval_end)
+          self.__sort_consumption(results)
           return results
         
         return None
@@ -788,49 +812,32 @@ class OctopusEnergyApiClient:
     tariff_parts = get_tariff_parts(tariff_code)
     if tariff_parts is None:
       return None
-    
-    product_code = tariff_parts.product_code
 
-    results = []
-
-    try:
-      client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/products/{product_code}/gas-tariffs/{tariff_code}/standard-unit-rates?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
-        data = await self.__async_read_response__(response, url)
-        if data is None:
-          return None
-        else:
-          results = rates_to_thirty_minute_increments(data, period_from, period_to, tariff_code, self._gas_price_cap)
-
-      return results
-    
-    except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-      raise TimeoutException()
+    return await self.__async_get_standard_rates("gas-tariffs", tariff_parts.product_code, tariff_code, period_from, period_to, self._gas_price_cap)
 
   async def async_get_gas_consumption(self, mprn, serial_number, period_from, period_to):
     """Get the current gas rates"""
     
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/gas-meter-points/{mprn}/meters/{serial_number}/consumption?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
+      period_from_str = period_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+      period_to_str = period_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+      url = self._consumption_url(base_url=self._base_url, meter_point_type="gas-meter-points", meter_point=mprn, serial_number=serial_number, period_from=period_from_str, period_to=period_to_str)
+      async with client.get(url, auth=self._auth) as response:
         data = await self.__async_read_response__(response, url)
         if (data is not None and "results" in data):
           data = data["results"]
           results = []
           for item in data:
-            item = self.__process_consumption(item)
+            start = parse_utc_datetime(item["interval_start"])
+            end = parse_utc_datetime(item["interval_end"])
 
             # For some reason, the end point returns slightly more data than we requested, so we need to filter out
-            # the results
-            if as_utc(item["start"]) >= period_from and as_utc(item["end"]) <= period_to:
-              results.append(item)
+            # the results before processing them
+            if start >= period_from and end <= period_to:
+              results.append(self.__process_consumption(item, start, end))
           
-          results.sort(key=self.__get_interval_end)
+          self.__sort_consumption(results)
           return results
         
         return None
@@ -843,9 +850,8 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/products/{product_code}'
-      async with client.get(url, auth=auth) as response:
+      url = self._product_url(base_url=self._base_url, product_code=product_code)
+      async with client.get(url, auth=self._auth) as response:
         return await self.__async_read_response__(response, url)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
@@ -853,34 +859,42 @@ class OctopusEnergyApiClient:
 
   async def async_get_electricity_standing_charge(self, tariff_code, period_from, period_to):
     """Get the electricity standing charges"""
-    tariff_parts = get_tariff_parts(tariff_code)
-    if tariff_parts is None:
-      return None
-    
-    product_code = tariff_parts.product_code
-    
-    result = None
+    return await self.__async_get_standing_charge("electricity-tariffs", tariff_code, period_from, period_to)
+
+  async def async_get_gas_standing_charge(self, tariff_code, period_from, period_to):
+    """Get the gas standing charges"""
+    return await self.__async_get_standing_charge("gas-tariffs", tariff_code, period_from, period_to)
+
+  async def __async_get_standard_rates(self, tariff_type: str, product_code: str, tariff_code: str, period_from: datetime, period_to: datetime, price_cap: float):
+    """Get the standard rates for the specified tariff type (e.g. electricity-tariffs or gas-tariffs)"""
+    results = []
 
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/products/{product_code}/electricity-tariffs/{tariff_code}/standing-charges?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
-        data = await self.__async_read_response__(response, url)
-        if (data is not None and "results" in data and len(data["results"]) > 0):
-          result = {
-            "start": parse_datetime(data["results"][0]["valid_from"]) if "valid_from" in data["results"][0] and data["results"][0]["valid_from"] is not None else None,
-            "end": parse_datetime(data["results"][0]["valid_to"]) if "valid_to" in data["results"][0] and data["results"][0]["valid_to"] is not None else None,
-            "value_inc_vat": float(data["results"][0]["value_inc_vat"])
-          }
-
-      return result
+      period_from_str = period_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+      period_to_str = period_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+      page = 1
+      has_more_rates = True
+      while has_more_rates:
+        url = self._paged_tariff_url(base_url=self._base_url, product_code=product_code, tariff_type=tariff_type, tariff_code=tariff_code, endpoint="standard-unit-rates", period_from=period_from_str, period_to=period_to_str, page=page)
+        data = await self.__async_get_tariff_data(client, url)
+        if data is None:
+          return None
+        else:
+          results.extend(rates_to_thirty_minute_increments(data, period_from, period_to, tariff_code, price_cap))
+          has_more_rates = "next" in data and data["next"] is not None
+          if has_more_rates:
+            page = page + 1
+    
     except TimeoutError:
-        _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-        raise TimeoutException()
+      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
+      raise TimeoutException()
+    
+    results.sort(key=start_key)
+    return results
 
-  async def async_get_gas_standing_charge(self, tariff_code, period_from, period_to):
-    """Get the gas standing charges"""
+  async def __async_get_standing_charge(self, tariff_type: str, tariff_code: str, period_from: datetime, period_to: datetime):
+    """Get the standing charge for the specified tariff type (e.g. electricity-tariffs or gas-tariffs)"""
     tariff_parts = get_tariff_parts(tariff_code)
     if tariff_parts is None:
       return None
@@ -891,16 +905,16 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      auth = aiohttp.BasicAuth(self._api_key, '')
-      url = f'{self._base_url}/v1/products/{product_code}/gas-tariffs/{tariff_code}/standing-charges?period_from={period_from.strftime("%Y-%m-%dT%H:%M:%SZ")}&period_to={period_to.strftime("%Y-%m-%dT%H:%M:%SZ")}'
-      async with client.get(url, auth=auth) as response:
-        data = await self.__async_read_response__(response, url)
-        if (data is not None and "results" in data and len(data["results"]) > 0):
-          result = {
-            "start": parse_datetime(data["results"][0]["valid_from"]) if "valid_from" in data["results"][0] and data["results"][0]["valid_from"] is not None else None,
-            "end": parse_datetime(data["results"][0]["valid_to"]) if "valid_to" in data["results"][0] and data["results"][0]["valid_to"] is not None else None,
-            "value_inc_vat": float(data["results"][0]["value_inc_vat"])
-          }
+      period_from_str = period_from.strftime("%Y-%m-%dT%H:%M:%SZ")
+      period_to_str = period_to.strftime("%Y-%m-%dT%H:%M:%SZ")
+      url = self._tariff_url(base_url=self._base_url, product_code=product_code, tariff_type=tariff_type, tariff_code=tariff_code, endpoint="standing-charges", period_from=period_from_str, period_to=period_to_str)
+      data = await self.__async_get_tariff_data(client, url)
+      if (data is not None and "results" in data and len(data["results"]) > 0):
+        result = {
+          "start": parse_datetime(data["results"][0]["valid_from"]) if "valid_from" in data["results"][0] and data["results"][0]["valid_from"] is not None else None,
+          "end": parse_datetime(data["results"][0]["valid_to"]) if "valid_to" in data["results"][0] and data["results"][0]["valid_to"] is not None else None,
+          "value_inc_vat": float(data["results"][0]["value_inc_vat"])
+        }
 
       return result
     except TimeoutError:
@@ -913,13 +927,13 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       # Get account response
       payload = { "query": intelligent_dispatches_query.format(account_id=account_id) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_get_intelligent_dispatches: {response_body}')
+        _LOGGER.debug('async_get_intelligent_dispatches: %s', response_body)
 
         if (response_body is not None and "data" in response_body):
           return IntelligentDispatches(
@@ -958,14 +972,13 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_settings_query.format(account_id=account_id) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_get_intelligent_settings: {response_body}')
+        _LOGGER.debug('async_get_intelligent_settings: %s', response_body)
 
-        _LOGGER.debug(f'Intelligent Settings: {response_body}')
         if (response_body is not None and "data" in response_body):
 
           return IntelligentSettings(
@@ -1016,7 +1029,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_settings_mutation.format(
         account_id=account_id,
         weekday_target_percentage=target_percentage,
@@ -1028,7 +1041,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_update_intelligent_car_target_percentage: {response_body}')
+        _LOGGER.debug('async_update_intelligent_car_target_percentage: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1044,7 +1057,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_settings_mutation.format(
         account_id=account_id,
         weekday_target_percentage=settings.charge_limit_weekday,
@@ -1056,7 +1069,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_update_intelligent_car_target_time: {response_body}')
+        _LOGGER.debug('async_update_intelligent_car_target_time: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1069,7 +1082,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_turn_on_bump_charge_mutation.format(
         account_id=account_id,
       ) }
@@ -1077,7 +1090,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_turn_on_intelligent_bump_charge: {response_body}')
+        _LOGGER.debug('async_turn_on_intelligent_bump_charge: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1090,7 +1103,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_turn_off_bump_charge_mutation.format(
         account_id=account_id,
       ) }
@@ -1098,7 +1111,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_turn_off_intelligent_bump_charge: {response_body}')
+        _LOGGER.debug('async_turn_off_intelligent_bump_charge: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1111,7 +1124,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_turn_on_smart_charge_mutation.format(
         account_id=account_id,
       ) }
@@ -1119,7 +1132,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_turn_on_intelligent_smart_charge: {response_body}')
+        _LOGGER.debug('async_turn_on_intelligent_smart_charge: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1132,7 +1145,7 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_turn_off_smart_charge_mutation.format(
         account_id=account_id,
       ) }
@@ -1140,7 +1153,7 @@ class OctopusEnergyApiClient:
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_turn_off_intelligent_smart_charge: {response_body}')
+        _LOGGER.debug('async_turn_off_intelligent_smart_charge: %s', response_body)
     except TimeoutError:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
@@ -1151,12 +1164,12 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": intelligent_device_query.format(account_id=account_id) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_get_intelligent_device: {response_body}')
+        _LOGGER.debug('async_get_intelligent_device: %s', response_body)
 
         if (response_body is not None and "data" in response_body and
             "registeredKrakenflexDevice" in response_body["data"]):
@@ -1187,12 +1200,12 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": wheel_of_fortune_query.format(account_id=account_id) }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_get_wheel_of_fortune_spins: {response_body}')
+        _LOGGER.debug('async_get_wheel_of_fortune_spins: %s', response_body)
 
         if (response_body is not None and "data" in response_body and
             "wheelOfFortuneSpins" in response_body["data"]):
@@ -1217,12 +1230,12 @@ class OctopusEnergyApiClient:
 
     try:
       client = self._create_client_session()
-      url = f'{self._base_url}/v1/graphql/'
+      url = self._graphql_url
       payload = { "query": wheel_of_fortune_mutation.format(account_id=account_id, supply_type="ELECTRICITY" if is_electricity == True else "GAS") }
       headers = { "Authorization": f"JWT {self._graphql_token}" }
       async with client.post(url, json=payload, headers=headers) as response:
         response_body = await self.__async_read_response__(response, url)
-        _LOGGER.debug(f'async_spin_wheel_of_fortune: {response_body}')
+        _LOGGER.debug('async_spin_wheel_of_fortune: %s', response_body)
 
         if (response_body is not None and 
             "data" in response_body and
@@ -1239,53 +1252,86 @@ class OctopusEnergyApiClient:
       _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
       raise TimeoutException()
 
-  def __get_interval_end(self, item):
-    return item["end"]
+  async def __async_get_tariff_data(self, client, url):
+    """Get the tariff data for the specified url, reusing our previous response if it hasn't changed since"""
+    headers = {}
+    cached_response = self._tariff_response_cache.get(url)
+    if cached_response is not None:
+      if cached_response["etag"] is not None:
+        headers["If-None-Match"] = cached_response["etag"]
+      if cached_response["last_modified"] is not None:
+        headers["If-Modified-Since"] = cached_response["last_modified"]
+
+    async with client.get(url, auth=self._auth, headers=headers) as response:
+      if response.status == 304 and cached_response is not None:
+        return cached_response["data"]
+
+      data = await self.__async_read_response__(response, url)
+
+      etag = response.headers.get("ETag")
+      last_modified = response.headers.get("Last-Modified")
+      self._tariff_response_cache.pop(url, None)
+      if data is not None and (etag is not None or last_modified is not None):
+        # Our urls change with our requested periods, so only keep our most recent responses
+        if len(self._tariff_response_cache) >= tariff_response_cache_size:
+          del self._tariff_response_cache[next(iter(self._tariff_response_cache))]
+
+        self._tariff_response_cache[url] = {
+          "etag": etag,
+          "last_modified": last_modified,
+          "data": data
+        }
 
-  def __is_night_rate(self, rate, is_smart_meter):
+      return data
+
+  def __sort_consumption(self, results):
+    # Our consumption is returned in descending order, so reversing is cheaper than sorting
+    if len(results) > 1 and results[0]["end"] > results[-1]["end"]:
+      results.reverse()
+
+    # Fallback to sorting in case our consumption wasn't returned in order
+    if any(results[index]["end"] > results[index + 1]["end"] for index in range(len(results) - 1)):
+      results.sort(key=end_key)
+
+  def __is_night_rate(self, start: datetime, is_smart_meter):
     # Normally the economy seven night rate is between 12am and 7am UK time
     # https://octopus.energy/help-and-faqs/articles/what-is-an-economy-7-meter-and-tariff/
     # However, if a smart meter is being used then the times are between 12:30am and 7:30am UTC time
     # https://octopus.energy/help-and-faqs/articles/what-happens-to-my-economy-seven-e7-tariff-when-i-have-a-smart-meter-installed/
     if is_smart_meter:
-        is_night_rate = self.__is_between_times(rate, "00:30:00", "07:30:00", True)
+        is_night_rate = self.__is_between_times(start, time(0, 30), time(7, 30), True)
     else:
-        is_night_rate = self.__is_between_times(rate, "00:00:00", "07:00:00", False)
+        is_night_rate = self.__is_between_times(start, time(0, 0), time(7, 0), False)
     return is_night_rate
 
-  def __is_between_times(self, rate, target_from_time, target_to_time, use_utc):
-    """Determines if a current rate is between two times"""
-    rate_local_valid_from = as_local(rate["start"])
-    rate_local_valid_to = as_local(rate["end"])
-
-    if use_utc:
-        rate_utc_valid_from = as_utc(rate["start"])
-        # We need to convert our times into local time to account for BST to ensure that our rate is valid between the target times.
-        from_date_time = as_local(parse_datetime(rate_utc_valid_from.strftime(f"%Y-%m-%dT{target_from_time}Z")))
-        to_date_time = as_local(parse_datetime(rate_utc_valid_from.strftime(f"%Y-%m-%dT{target_to_time}Z")))
-    else:
-        local_now = now()
-        # We need to convert our times into local time to account for BST to ensure that our rate is valid between the target times.
-        from_date_time = as_local(parse_datetime(rate_local_valid_from.strftime(f"%Y-%m-%dT{target_from_time}{local_now.strftime('%z')}")))
-        to_date_time = as_local(parse_datetime(rate_local_valid_from.strftime(f"%Y-%m-%dT{target_to_time}{local_now.strftime('%z')}")))
+  def __is_between_times(self, start: datetime, target_from_time: time, target_to_time: time, use_utc):
+    """Determines if the start of a rate is between two times"""
+    # Our target times are relative to the day of the rate in either UTC or local time, so we only need to compare against
+    # the wall clock time of the rate in that timezone (e.g. to account for BST)
+    rate_valid_from = as_utc(start) if use_utc else as_local(start)
+    is_valid = target_from_time <= rate_valid_from.time() and rate_valid_from.time() < target_to_time
 
-    _LOGGER.debug('is_valid: %s; from_date_time: %s; to_date_time: %s; rate_local_valid_from: %s; rate_local_valid_to: %s', rate_local_valid_from >= from_date_time and rate_local_valid_from < to_date_time, from_date_time, to_date_time, rate_local_valid_from, rate_local_valid_to)
+    # This is called for every rate, so avoid building our log arguments unless they'll be used
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('is_valid: %s; target_from_time: %s; target_to_time: %s; rate_local_valid_from: %s', is_valid, target_from_time, target_to_time, as_local(start))
 
-    return rate_local_valid_from >= from_date_time and rate_local_valid_from < to_date_time
+    return is_valid
 
-  def __process_consumption(self, item):
+  def __process_consumption(self, item, start: datetime, end: datetime):
     return {
       "consumption": float(item["consumption"]),
-      "start": as_utc(parse_datetime(item["interval_start"])),
-      "end": as_utc(parse_datetime(item["interval_end"]))
+      "start": start,
+      "end": end
     }
 
   async def __async_read_response__(self, response, url):
     """Reads the response, logging any json errors"""
 
-    text = await response.text()
+    # Read the raw bytes so our json can be parsed without decoding the body into a string first
+    body = await response.read()
 
     if response.status >= 400:
+      text = body.decode("utf-8", errors="replace")
       if response.status >= 500:
         msg = f'DO NOT REPORT - Octopus Energy server error ({url}): {response.status}; {text}'
         _LOGGER.warning(msg)
@@ -1300,9 +1346,9 @@ class OctopusEnergyApiClient:
 
     data_as_json = None
     try:
-      data_as_json = json.loads(text)
-    except:
-      raise Exception(f'Failed to extract response json: {url}; {text}')
+      data_as_json = orjson.loads(body)
+    except orjson.JSONDecodeError:
+      raise Exception(f'Failed to extract response json: {url}; {body.decode("utf-8", errors="replace")}')
     
     if ("graphql" in url and "errors" in data_as_json):
       msg = f'Errors in request ({url}): {data_as_json["errors"]}'
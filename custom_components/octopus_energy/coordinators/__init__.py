@@ -87,7 +87,7 @@ async def async_check_valid_tariff(hass, account_id: str, client: OctopusEnergyA
           )
         else:
           hass.data[DOMAIN][account_id][tariff_key] = True
-      except:
+      except Exception:
         _LOGGER.debug(f"Failed to retrieve product info for '{tariff_parts.product_code}'")
 
 def __raise_rate_event(event_key: str,
@@ -43,7 +43,7 @@ async def async_merge_dispatch_data(hass, account_id: str, completed_dispatches)
 
   try:
     saved_dispatches = await store.async_load()
-  except:
+  except Exception:
     saved_dispatches = []
     _LOGGER.warning('Local intelligent dispatch data corrupted. Resetting...')
 
@@ -19,7 +19,7 @@ from ..const import (
   REFRESH_RATE_IN_MINUTES_PREVIOUS_CONSUMPTION
 )
 
-from ..api_client import (ApiException, OctopusEnergyApiClient)
+from ..api_client import (ApiException, OctopusEnergyApiClient, end_key)
 from ..api_client.intelligent_dispatches import IntelligentDispatches
 from ..utils import private_rates_to_public_rates
 
@@ -30,12 +30,9 @@ from ..utils.rate_information import get_min_max_average_rates
 
 _LOGGER = logging.getLogger(__name__)
 
-def __get_interval_end(item):
-    return item["end"]
-
 def __sort_consumption(consumption_data):
   sorted = consumption_data.copy()
-  sorted.sort(key=__get_interval_end)
+  sorted.sort(key=end_key)
   return sorted
 
 class PreviousConsumptionCoordinatorResult(BaseCoordinatorResult):
@@ -1,5 +1,6 @@
 from datetime import timedelta
 import re
+import asyncio
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant
@@ -62,8 +63,10 @@ async def async_refresh_previous_electricity_consumption_data(
       )
       return
 
-    consumption_data = await client.async_get_electricity_consumption(mpan, serial_number, period_from, period_to)
-    rates = await client.async_get_electricity_rates(tariff_code, is_smart_meter, period_from, period_to)
+    [consumption_data, rates] = await asyncio.gather(
+      client.async_get_electricity_consumption(mpan, serial_number, period_from, period_to),
+      client.async_get_electricity_rates(tariff_code, is_smart_meter, period_from, period_to)
+    )
 
     consumption_and_cost = calculate_electricity_consumption_and_cost(
       period_from,
@@ -149,8 +152,10 @@ async def async_refresh_previous_gas_consumption_data(
       )
       return
 
-    consumption_data = await client.async_get_gas_consumption(mprn, serial_number, period_from, period_to)
-    rates = await client.async_get_gas_rates(tariff_code, period_from, period_to)
+    [consumption_data, rates] = await asyncio.gather(
+      client.async_get_gas_consumption(mprn, serial_number, period_from, period_to),
+      client.async_get_gas_rates(tariff_code, period_from, period_to)
+    )
 
     consumption_and_cost = calculate_gas_consumption_and_cost(
       consumption_data,
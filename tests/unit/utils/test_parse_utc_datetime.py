@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+import pytest
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+from custom_components.octopus_energy.api_client import parse_utc_datetime
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value",[
+  ("2023-01-10T00:30:00Z"),
+  ("2023-06-10T00:30:00+01:00"),
+  ("2023-06-10T00:30:00.123000Z"),
+])
+async def test_when_value_has_timezone_then_utc_date_time_returned(value: str):
+  # Act
+  result = parse_utc_datetime(value)
+
+  # Assert
+  assert result == as_utc(parse_datetime(value))
+  assert result.utcoffset().total_seconds() == 0
+
+@pytest.mark.asyncio
+async def test_when_value_has_no_timezone_then_treated_as_utc():
+  # Act
+  result = parse_utc_datetime("2023-01-10T00:30:00")
+
+  # Assert
+  assert result == datetime(2023, 1, 10, 0, 30, tzinfo=timezone.utc)
@@ -87,4 +87,43 @@ async def test_go_rates_bst():
 
     start_time = end_time
 
-  assert start_time == as_utc(parse_datetime("2022-10-10T00:00+01:00"))
\ No newline at end of file
+  assert start_time == as_utc(parse_datetime("2022-10-10T00:00+01:00"))
+@pytest.mark.asyncio
+async def test_when_is_valid_period_provided_then_only_valid_periods_returned():
+  # Act
+  period_from = as_utc(parse_datetime("2022-10-09T00:00Z"))
+  period_to = as_utc(parse_datetime("2022-10-10T00:00Z"))
+  tariff_code = "test_tariff"
+  rates = [
+		{
+			"value_exc_vat": 7.142,
+			"value_inc_vat": 7.4991,
+			"valid_from": "2022-10-08T00:00:00Z",
+			"valid_to": None
+		}
+  ]
+  
+  result = rates_to_thirty_minute_increments(
+    {
+      "results": rates
+    }, 
+    period_from,
+    period_to,
+    tariff_code,
+    None,
+    lambda start: start.hour < 7
+  )
+
+  # Assert
+  assert result is not None
+  assert len(result) == 14
+
+  start_time = period_from
+  for index in range(14):
+    end_time = start_time + timedelta(minutes=30)
+    assert result[index]["start"] == start_time
+    assert result[index]["end"] == end_time
+    assert result[index]["value_inc_vat"] == rates[0]["value_inc_vat"]
+    assert result[index]["tariff_code"] == tariff_code
+
+    start_time = end_time